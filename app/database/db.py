@@ -273,41 +273,54 @@ async def read_classes(class_ids: List[int]) -> Optional[List[Class]]:
 
 
 async def get_subject_grade_levels(subject_id: int) -> Dict[str, Any]:
+    subjects = await get_subjects_grade_levels([subject_id])
+    if subject_id not in subjects:
+        error = f"Subject with ID {subject_id} not found or has no classes"
+        logger.error(
+            f"Failed to get subject and classes for subject ID {subject_id}: {error}"
+        )
+        raise Exception(f"Failed to get subject and classes for subject ID: {error}")
+    return subjects[subject_id]
+
+
+async def get_subjects_grade_levels(
+    subject_ids: List[int],
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Get the subject names and classes for several subjects in a single query.
+
+    Args:
+        subject_ids: The IDs of the subjects to read
+
+    Returns:
+        Dict mapping each found subject ID to {"subject_name": ..., "classes": [...]}
+    """
     async with get_session() as session:
         try:
             statement = (
                 select(
+                    Subject.id.label("subject_id"),
                     Subject.name.label("subject_name"),
                     Class.id,
                     Class.name,
-                    Class.grade_level,
                 )
                 .join(Class, Class.subject_id == Subject.id)
-                .where(Subject.id == subject_id)
+                .where(Subject.id.in_(subject_ids))
             )
             result = await session.execute(statement)
-            rows = result.fetchall()
-            if not rows:
-                raise Exception(
-                    f"Subject with ID {subject_id} not found or has no classes"
-                )
 
-            subject_name = rows[0].subject_name
-            classes = [
-                {
-                    "id": str(row.id),
-                    "title": row.name,
-                }
-                for row in rows
-            ]
-            return {"subject_name": subject_name, "classes": classes}
+            subjects: Dict[int, Dict[str, Any]] = {}
+            for row in result.fetchall():
+                subject = subjects.setdefault(
+                    row.subject_id, {"subject_name": row.subject_name, "classes": []}
+                )
+                subject["classes"].append({"id": str(row.id), "title": row.name})
+            return subjects
         except Exception as e:
             logger.error(
-                f"Failed to get subject and classes for subject ID {subject_id}: {str(e)}"
-            )
-            raise Exception(
-                f"Failed to get subject and classes for subject ID: {str(e)}"
+                f"Failed to get subjects and classes for subject IDs {subject_ids}: {str(e)}"
             )
+            raise Exception(f"Failed to get subjects and classes: {str(e)}")
 
 
 async def get_class_ids_from_class_info(
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
@@ -23,9 +24,15 @@ db_engine = create_async_engine(
     get_database_url(),
     echo=False,
     pool_size=20,  # Adjust based on your concurrent users
+    max_overflow=30,  # Allow bursts of up to 50 connections
+    pool_recycle=300,  # Replace connections older than 5 minutes
     pool_pre_ping=True,  # Verify connections before usage
+    connect_args={"command_timeout": 30},  # asyncpg query timeout (seconds)
 )
 
+# Number of connections opened at startup so early requests skip the handshake
+POOL_WARMUP_SIZE = 10
+
 # Create a session factory
 AsyncSessionLocal = sessionmaker(
     bind=db_engine,
@@ -48,12 +55,16 @@ async def get_session():
         await session.close()
 
 
+async def _check_connection() -> None:
+    async with db_engine.connect() as conn:
+        await conn.scalar(text("SELECT 1"))
+
+
 async def init_db() -> None:
-    """Minimal database initialization"""
+    """Verify the database connection and warm up the connection pool"""
     try:
-        async with db_engine.connect() as conn:
-            await conn.scalar(text("SELECT 1"))
-            logger.info("Database connection verified")
+        await asyncio.gather(*(_check_connection() for _ in range(POOL_WARMUP_SIZE)))
+        logger.info("Database connection verified")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
         raise
@@ -19,6 +19,10 @@ async def lifespan(app: FastAPI):
         await init_db()
         logger.info("Database initialized successfully")
 
+        # Open the shared HTTP client here so shutdown can close it again
+        whatsapp_client.open()
+        logger.info("HTTP client initialized")
+
         # Additional startup tasks can go here
         logger.info("Application startup completed")
         yield
@@ -26,9 +30,13 @@ async def lifespan(app: FastAPI):
         logger.error(f"Error during startup: {e}")
         raise
     finally:
-        # Cleanup
-        await db_engine.dispose()
-        logger.info("Database connections closed")
+        # Cleanup, closing the HTTP client even if disposing the engine fails
+        try:
+            await db_engine.dispose()
+            logger.info("Database connections closed")
+        finally:
+            await whatsapp_client.aclose()
+            logger.info("HTTP client connections closed")
 
 
 # Create a FastAPI application instance
@@ -44,9 +52,11 @@ async def webhook_get(request: Request) -> JSONResponse:
 
 
 @app.post("/webhooks", dependencies=[Depends(signature_required)])
-async def webhook_post(request: Request) -> JSONResponse:
+async def webhook_post(
+    request: Request, background_tasks: BackgroundTasks
+) -> JSONResponse:
     logger.debug("webhook_post is being called")
-    return await handle_request(request, endpoint="webhooks")
+    return await handle_request(request, background_tasks, endpoint="webhooks")
 
 
 @app.post("/flows", dependencies=[Depends(flows_signature_required)])
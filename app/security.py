@@ -12,11 +12,11 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
-def validate_signature(payload: str, signature: str) -> bool:
-    # Use the meta app secret to hash the payload
+def validate_signature(payload: bytes, signature: str) -> bool:
+    # Use the meta app secret to hash the raw payload bytes
     expected_signature = hmac.new(
         bytes(settings.meta_app_secret.get_secret_value(), "utf-8"),
-        msg=payload.encode("utf-8"),
+        msg=payload,
         digestmod=hashlib.sha256,
     ).hexdigest()
 
@@ -29,7 +29,7 @@ async def signature_required(request: Request) -> None:
     signature = request.headers.get("X-Hub-Signature-256", "")[7:]  # Removing 'sha256='
     payload = await request.body()
 
-    if not validate_signature(payload.decode("utf-8"), signature):
+    if not validate_signature(payload, signature):
         logger.error("Signature verification failed!")
         raise HTTPException(status_code=403, detail="Invalid signature")
 
@@ -39,7 +39,7 @@ async def flows_signature_required(request: Request) -> None:
     signature = request.headers.get("X-Hub-Signature-256", "")[7:]  # Removing 'sha256='
     payload = await request.body()
 
-    if not validate_signature(payload.decode("utf-8"), signature):
+    if not validate_signature(payload, signature):
         logger.error("Business signature verification failed!")
         # NOTE : We are using a custom status code here, 432. And user will see A generic error on the client.
         raise HTTPException(status_code=432, detail="Invalid business signature")
@@ -279,8 +279,11 @@ class FlowService:
         try:
             # NOTE: Instead of partially updating the users class_info, we send the select classes flows and update it that way
             # TODO: Replace this with a single flow being sent
+            subjects_data = await db.get_subjects_grade_levels(selected_subject_ids)
             for subject_id in selected_subject_ids:
-                await self.send_select_classes_flow(user, subject_id)
+                await self.send_select_classes_flow(
+                    user, subject_id, subject_data=subjects_data.get(subject_id)
+                )
         except Exception as e:
             await whatsapp_client.send_message(
                 user.wa_id, strings.get_string(StringCategory.ERROR, "general")
@@ -408,11 +411,16 @@ class FlowService:
 
     # The same flow is sent for both settings and onboarding
     async def send_select_classes_flow(
-        self, user: User, subject_id: int, is_update: bool = False
+        self,
+        user: User,
+        subject_id: int,
+        is_update: bool = False,
+        subject_data: Optional[Dict] = None,
     ) -> None:
         try:
-            # Read the subject classes data from the database
-            subject_data = await db.get_subject_grade_levels(subject_id)
+            # Read the subject classes data from the database unless already fetched
+            if subject_data is None:
+                subject_data = await db.get_subject_grade_levels(subject_id)
             subject_title = enums.SubjectName(subject_data["subject_name"]).title_format
             classes = subject_data["classes"]
 
@@ -1,8 +1,10 @@
-import json
 import logging
 import asyncio
+from functools import lru_cache
+from itertools import islice
 from typing import List, Optional
 from openai.types.chat import ChatCompletionMessageToolCall
+import orjson
 
 from app.database.models import Message, User
 from app.database.enums import MessageRole
@@ -13,6 +15,14 @@ from app.utils.prompt_manager import prompt_manager
 from app.tools.registry import tools_functions, tools_metadata
 
 
+@lru_cache(maxsize=256)
+def _format_system_prompt(user_name: Optional[str], class_info: str) -> str:
+    """The system prompt only depends on the user's name and classes, so reuse it per user."""
+    return prompt_manager.format_prompt(
+        "twiga_system", user_name=user_name, class_info=class_info
+    )
+
+
 class MessageProcessor:
     """Handles processing and batching of messages for a single user."""
 
@@ -75,11 +85,11 @@ class LLMClient:
                 Message(
                     user_id=user.id,
                     role=MessageRole.system,
-                    content=json.dumps(
+                    content=orjson.dumps(
                         {
                             "error": "Tools are not available right now, no available resources."
                         }
-                    ),
+                    ).decode(),
                 )
             ]
 
@@ -87,7 +97,7 @@ class LLMClient:
         for tool_call in tool_calls:
             try:
                 function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
+                function_args = orjson.loads(tool_call.function.arguments)
                 # TODO: Make this more modular, depending on the need for each tool
                 function_args["user"] = user
                 function_args["resources"] = resources
@@ -104,7 +114,7 @@ class LLMClient:
                         Message(
                             user_id=user.id,
                             role=MessageRole.tool,
-                            content=json.dumps(result),
+                            content=orjson.dumps(result).decode(),
                             tool_call_id=tool_call.id,
                         )
                     )
@@ -114,7 +124,7 @@ class LLMClient:
                     Message(
                         user_id=user.id,
                         role=MessageRole.tool,
-                        content=json.dumps({"error": str(e)}),
+                        content=orjson.dumps({"error": str(e)}).decode(),
                         tool_call_id=tool_call.id,
                     )
                 )
@@ -238,9 +248,8 @@ class LLMClient:
         formatted_messages = [
             {
                 "role": MessageRole.system,
-                "content": prompt_manager.format_prompt(
-                    "twiga_system", user_name=user.name, class_info=user.class_info
-                ),
+                # class_info is an unhashable dict; twiga_system renders it with str() anyway
+                "content": _format_system_prompt(user.name, str(user.class_info)),
             }
         ]
 
@@ -256,11 +265,8 @@ class LLMClient:
                     f"Unusual message count scenario detected: There are {message_count} new messages but only {db_message_count} messages in the database."
                 )
 
-            old_messages = (
-                database_messages[:-message_count]
-                if message_count > 0
-                else database_messages
-            )
+            # Iterate over the older messages in place rather than copying a slice
+            old_messages = islice(database_messages, db_message_count - message_count)
             formatted_messages.extend(msg.to_api_format() for msg in old_messages)
 
         # Add new messages
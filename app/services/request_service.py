@@ -1,8 +1,9 @@
 import json
 import logging
-from typing import Literal, Optional
+from typing import Literal
 from fastapi import BackgroundTasks, Request
 from fastapi.responses import JSONResponse
+import orjson
 
 from app.database.models import (
     ClassInfo,
@@ -28,7 +29,7 @@ logger = logging.getLogger(__name__)
 
 async def handle_request(
     request: Request,
-    bg_tasks: Optional[BackgroundTasks] = None,
+    bg_tasks: BackgroundTasks,
     endpoint: Literal["webhooks", "flows"] = "webhooks",
 ) -> JSONResponse:
     """
@@ -37,7 +38,8 @@ async def handle_request(
     """
     try:
 
-        body = await request.json()
+        # The body is already cached by the signature check, so parse the raw bytes
+        body = orjson.loads(await request.body())
 
         # Route the request to the appropriate handler
         if endpoint == "flows":
@@ -59,7 +61,9 @@ async def handle_request(
             case RequestType.OUTDATED:
                 return whatsapp_client.handle_outdated_message(body)
             case RequestType.VALID_MESSAGE:
-                return await handle_valid_message(body)
+                # Acknowledge Meta right away and process the message after responding
+                bg_tasks.add_task(handle_valid_message_task, body)
+                return JSONResponse(content={"status": "ok"}, status_code=200)
 
         raise Exception(f"Invalid request type. This is the request body: {body}")
     except json.JSONDecodeError:
@@ -76,6 +80,16 @@ async def handle_request(
         )
 
 
+async def handle_valid_message_task(body: dict) -> None:
+    """
+    Background wrapper for handle_valid_message, the response has already been sent
+    """
+    try:
+        await handle_valid_message(body)
+    except Exception as e:
+        logger.error(f"Unexpected error while processing message: {str(e)}")
+
+
 async def handle_valid_message(body: dict) -> JSONResponse:
     # Extract message information and create/get user
     message_info = extract_message_info(body)
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from fastapi import Request
 from fastapi.responses import PlainTextResponse, JSONResponse
+import hmac
 import logging
 
 import httpx
@@ -18,7 +19,17 @@ class WhatsAppClient:
         }
         self.url = f"https://graph.facebook.com/{settings.meta_api_version}/{settings.whatsapp_cloud_number_id}"
         self.logger = logging.getLogger(__name__)
-        self.client = httpx.AsyncClient(base_url=self.url)
+        # One pooled client is shared by every outbound Graph API request
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The shared HTTP client, (re)opened on first use after startup or aclose().
+        """
+        if self._client is None or self._client.is_closed:
+            self.open()
+        return self._client
 
     async def send_message(
         self, wa_id: str, message: str, options: Optional[List[str]] = None
@@ -34,6 +45,26 @@ class WhatsAppClient:
         except Exception as e:
             self.logger.error("Unexpected Error: %s", e)
 
+    def open(self) -> None:
+        """
+        Opens the shared HTTP client and its connection pool.
+        """
+        self._client = httpx.AsyncClient(
+            base_url=self.url,
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=20, keepalive_expiry=90
+            ),
+            timeout=httpx.Timeout(30.0),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared HTTP client and its pooled connections.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def verify(self, request: Request):
         """
         Verifies the webhook for WhatsApp. This is required.
@@ -49,9 +80,9 @@ class WhatsAppClient:
                 status_code=400,
             )
 
-        if (
-            mode == "subscribe"
-            and token == settings.whatsapp_verify_token.get_secret_value()
+        if mode == "subscribe" and hmac.compare_digest(
+            token.encode("utf-8"),
+            settings.whatsapp_verify_token.get_secret_value().encode("utf-8"),
         ):
             self.logger.info("WEBHOOK_VERIFIED")
             return PlainTextResponse(content=challenge)
@@ -47,10 +47,14 @@ async def generate_exercise(
         )
 
         logger.debug(
-            f"Retrieved {len(retrieved_content)} content chunks, this is the first: {retrieved_content[0]}"
+            "Retrieved %s content chunks, this is the first: %s",
+            len(retrieved_content),
+            retrieved_content[:1],
         )
         logger.debug(
-            f"Retrieved {len(retrieved_content)} exercise chunks, this is the first: {retrieved_content[0]}"
+            "Retrieved %s exercise chunks, this is the first: %s",
+            len(retrieved_exercises),
+            retrieved_exercises[:1],
         )
 
         # Format the context and prompt
@@ -76,10 +80,8 @@ async def _generate(prompt: str, query: str, verbose: bool = False) -> str:
         ]
 
         if verbose:
-            print("--------------------------")
-            print(f"System prompt: \n{prompt}")
-            print("--------------------------")
-            print(f"User prompt: \n{query}")
+            logger.debug("System prompt: \n%s", prompt)
+            logger.debug("User prompt: \n%s", query)
 
         res = await async_llm_request(
             model=llm_settings.exercise_generator_model,
@@ -32,7 +32,9 @@ async def search_knowledge(
         )
 
         logger.debug(
-            f"Retrieved {len(retrieved_content)} content chunks, this is the first: {retrieved_content[0]}"
+            "Retrieved %s content chunks, this is the first: %s",
+            len(retrieved_content),
+            retrieved_content[:1],
         )
 
         # Format the context and prompt
@@ -1,5 +1,4 @@
 import base64
-import json
 from typing import Any, Dict, List, Tuple
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
@@ -7,14 +6,18 @@ from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding as asym_padding
 import logging
 
-import httpx
+import orjson
 from app.config import settings
 from cryptography.fernet import Fernet
 
 from app.database.models import User
+from app.services.whatsapp_service import whatsapp_client
 
 logger = logging.getLogger(__name__)
 
+# Shared, read-only placeholder sent when a subject has no classes
+_NO_CLASSES_FALLBACK = ({"id": "0", "title": "No classes available"},)
+
 
 def decrypt_aes_key(encrypted_aes_key: str) -> bytes:
     private_key_pem = settings.whatsapp_business_private_key.get_secret_value()
@@ -49,11 +52,11 @@ def decrypt_payload(encrypted_data: str, aes_key: bytes, iv: str) -> dict:
         backend=default_backend(),
     ).decryptor()
     decrypted_data_bytes = decryptor.update(encrypted_data_body) + decryptor.finalize()
-    return json.loads(decrypted_data_bytes.decode("utf-8"))
+    return orjson.loads(decrypted_data_bytes)
 
 
 def encrypt_response(response: dict, aes_key: bytes, iv: str) -> str:
-    response_bytes = json.dumps(response).encode("utf-8")
+    response_bytes = orjson.dumps(response)
     iv_bytes = base64.b64decode(iv)
     inverted_iv_bytes = bytes(~b & 0xFF for b in iv_bytes)
     encryptor = Cipher(
@@ -198,16 +201,11 @@ async def send_whatsapp_flow_message(
         },
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"https://graph.facebook.com/{settings.meta_api_version}/{settings.whatsapp_cloud_number_id}/messages",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {settings.whatsapp_api_token.get_secret_value()}",
-            },
-            json=payload,
-        )
-        logger.info(f"WhatsApp API response: {response.status_code} - {response.text}")
+    # Reuse the WhatsApp client's connection pool instead of opening a new one per flow
+    response = await whatsapp_client.client.post(
+        "/messages", headers=whatsapp_client.headers, content=orjson.dumps(payload)
+    )
+    logger.info(f"WhatsApp API response: {response.status_code} - {response.text}")
 
 
 def create_flow_response_payload(
@@ -241,13 +239,8 @@ def create_subject_class_payload(
     """
     has_items = len(classes) > 0
     return {
-        "classes": (
-            classes
-            if has_items
-            else [
-                {"id": "0", "title": "No classes available"}
-            ]  # if no classes, show a dummy class it is required for the client
-        ),
+        # if no classes, show a dummy class it is required for the client
+        "classes": classes if has_items else _NO_CLASSES_FALLBACK,
         "has_classes": has_items,
         "no_classes_text": f"Sorry, currently there are no active classes for {subject_title}.",
         "select_class_text": f"This helps us find the best answers for your questions in {subject_title}.",
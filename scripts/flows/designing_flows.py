@@ -1,97 +1,91 @@
-from typing import Any, Dict
-from fastapi.responses import PlainTextResponse
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+import asyncio
 import logging
+import time
 
 from app.database import db
 from app.database.models import User
-import app.utils.flow_utils as futil
+from app.utils.flow_utils import (
+    create_flow_response_payload as _mk_payload,
+    create_subject_class_payload,
+)
+
+__all__ = [
+    "handle_select_classes_init_action",
+    "handle_onboarding_init_action",
+    "handle_select_subjects_init_action",
+]
 
 logger = logging.getLogger(__name__)
 
+# The onboarding init payload only varies by the user's name, so build the envelope once
+_ONBOARDING_TEMPLATE = _mk_payload(screen="personal_info", data={"full_name": None})
+
+# Shared, read-only fallback: WhatsApp flows expect a non-empty list of subjects with id and title
+_NO_SUBJECTS_FALLBACK = ({"id": "0", "title": "No subjects available"},)
+
+# Subjects and classes rarely change, so init actions reuse query results for up to the TTL
+_CACHE_TTL_SECONDS = 300
+_cache: Dict[Hashable, Tuple[float, Any]] = {}
+_cache_lock = asyncio.Lock()
+
+
+async def _cached(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached result for key, re-fetching it once the TTL has expired"""
+    async with _cache_lock:
+        entry = _cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        value = await fetch()
+        _cache[key] = (time.monotonic() + _CACHE_TTL_SECONDS, value)
+        return value
+
 
 async def handle_select_classes_init_action(user: User) -> Dict[str, Any]:
-    try:
-        subject_id = 1  # Hardcoded subject_id as 1, because init action is only used when testing
-        subject_data = await db.get_subject_grade_levels(subject_id)
-        subject_title = subject_data["subject_name"]
-        classes = subject_data["classes"]
-        logger.debug(f"Subject title for subject ID {subject_id}: {subject_title}")
-        logger.debug(f"Available classes for subject ID {subject_id}: {classes}")
-
-        select_class_question_text = f"Select the class you are in for {subject_title}."
-        select_class_text = f"This helps us find the best answers for your questions in {subject_title}."
-        no_classes_text = (
-            f"Sorry, currently there are no active classes for {subject_title}."
-        )
-        has_classes = len(classes) > 0
-
-        response_payload = futil.create_flow_response_payload(
-            screen="select_classes",
-            data={
-                "classes": (
-                    classes
-                    if has_classes
-                    else [
-                        {
-                            "id": "0",
-                            "title": "No classes available",
-                        }
-                    ]
-                ),
-                "has_classes": has_classes,
-                "no_classes_text": no_classes_text,
-                "select_class_text": select_class_text,
-                "select_class_question_text": select_class_question_text,
-                "subject_id": str(subject_id),
-            },
-        )
-
-        return response_payload
-
-    except ValueError as e:
-        return PlainTextResponse(
-            content={"error_msg": str(e)},
-            status_code=422,
-        )
+    # Hardcoded subject_id as 1, because init action is only used when testing
+    subject_id = 1
+    subject_data = await _cached(
+        ("subject_grade_levels", subject_id),
+        lambda: db.get_subject_grade_levels(subject_id),
+    )
+    subject_title = subject_data["subject_name"]
+    classes = subject_data["classes"]
+    logger.debug("Subject title for subject ID %s: %s", subject_id, subject_title)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Available classes for subject ID %s: %s", subject_id, classes)
+
+    response_payload = _mk_payload(
+        screen="select_classes",
+        data=create_subject_class_payload(
+            subject_title=subject_title,
+            classes=classes,
+            is_update=False,
+            subject_id=str(subject_id),
+        ),
+    )
+
+    return response_payload
 
 
 async def handle_onboarding_init_action(user: User) -> Dict[str, Any]:
-    try:
-        response_payload = futil.create_flow_response_payload(
-            screen="personal_info",
-            data={
-                "full_name": user.name,
-            },
-        )
-        return response_payload
-    except ValueError as e:
-        return PlainTextResponse(content={"error_msg": str(e)}, status_code=422)
+    return {**_ONBOARDING_TEMPLATE, "data": {"full_name": user.name}}
 
 
 async def handle_select_subjects_init_action(user: User) -> Dict[str, Any]:
-    try:
-        # Get available subjects from the database
-        subjects = await db.get_available_subjects()
-        logger.debug(f"Available subjects: {subjects}")
-
-        select_subject_text = "This helps us find the best answers for your questions."
-        no_subjects_text = "Sorry, currently there are no active subjects."
-        has_subjects = len(subjects) > 0
-
-        response_payload = futil.create_flow_response_payload(
-            screen="select_subjects",
-            data={
-                "subjects": (
-                    subjects
-                    if has_subjects
-                    else [{"id": "0", "title": "No subjects available"}]
-                ),  # doing this because the response in whatsapp flows expects a list of subjects with id and title
-                "has_subjects": has_subjects,
-                "no_subjects_text": no_subjects_text,
-                "select_subject_text": select_subject_text,
-            },
-        )
-        return response_payload
-
-    except ValueError as e:
-        return PlainTextResponse(content={"error_msg": str(e)}, status_code=422)
+    # Get available subjects from the database
+    subjects = await _cached("available_subjects", db.get_available_subjects)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Available subjects: %s", subjects)
+
+    has_subjects = len(subjects) > 0
+
+    response_payload = _mk_payload(
+        screen="select_subjects",
+        data={
+            "subjects": subjects if has_subjects else _NO_SUBJECTS_FALLBACK,
+            "has_subjects": has_subjects,
+            "no_subjects_text": "Sorry, currently there are no active subjects.",
+            "select_subject_text": "This helps us find the best answers for your questions.",
+        },
+    )
+    return response_payload